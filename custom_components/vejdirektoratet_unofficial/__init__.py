@@ -2,13 +2,16 @@
 
 import logging
 
+import httpx
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.httpx_client import create_async_httpx_client
 
 from .api import VejdirektoratetAPI
-from .const import DOMAIN
+from .const import DATA_TILE_CLIENT, DOMAIN
 from .coordinator import VejdirektoratetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,10 +19,23 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS = [Platform.SENSOR]
 
 
+@callback
+def _async_get_tile_client(hass: HomeAssistant) -> httpx.AsyncClient:
+    """Return the HTTP/2 tile client shared by all config entries.
+
+    Home Assistant closes the client on shutdown, so it is created once and
+    reused across reloads.
+    """
+    if (client := hass.data.get(DATA_TILE_CLIENT)) is None:
+        client = create_async_httpx_client(hass, http2=True)
+        hass.data[DATA_TILE_CLIENT] = client
+    return client
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Vejdirektoratet from a config entry."""
     session = async_get_clientsession(hass)
-    api = VejdirektoratetAPI(session)
+    api = VejdirektoratetAPI(session, _async_get_tile_client(hass))
 
     coordinator = VejdirektoratetCoordinator(hass, api)
 
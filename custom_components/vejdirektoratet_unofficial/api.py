@@ -1,12 +1,27 @@
 """API client for Vejdirektoratet winter roads."""
 
+import asyncio
 import logging
 import math
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from functools import cached_property, lru_cache
 
 import aiohttp
+import httpx
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .const import (
     WINTER_STATUS_URL,
@@ -15,20 +30,33 @@ from .const import (
     TILE_GRID_ORIGIN_X,
     TILE_GRID_ORIGIN_Y,
     TILE_GRID_EXTENT_WIDTH,
+    TILE_MAX_CONCURRENCY,
     VALID_ROAD_CLASSES,
 )
+from .mvt_decoder import extract_feature_ids
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SaltingStatus(Enum):
-    """Road salting status based on time since last salting."""
+class SaltingStatus(IntEnum):
+    """Road salting status based on time since last salting.
+
+    Values are contiguous from 0 so they can index lookup tuples.
+    """
+
+    SALTING_NOW = 0
+    LESS_THAN_12H = 1
+    BETWEEN_12H_48H = 2
+    MORE_THAN_48H = 3
+    UNKNOWN = 4
+
+    @property
+    def key(self) -> str:
+        """Return the stable string key used in IDs and attributes."""
+        return self.name.lower()
 
-    SALTING_NOW = "salting_now"
-    LESS_THAN_12H = "less_than_12h"
-    BETWEEN_12H_48H = "between_12h_48h"
-    MORE_THAN_48H = "more_than_48h"
-    UNKNOWN = "unknown"
+
+_STATUS_BY_CODE = tuple(SaltingStatus)
 
 
 @dataclass
@@ -37,19 +65,81 @@ class RoadSegment:
 
     feature_id: str
     road_class: int
-    salting_time: datetime | None
+    salting_epoch: int
     salting_now: bool
     condition: int
     service_level: int
     status: SaltingStatus
 
+    @cached_property
+    def salting_time(self) -> datetime | None:
+        """Return the last salting time, if known."""
+        if self.salting_epoch > 0:
+            return datetime.fromtimestamp(self.salting_epoch)
+        return None
+
+
+# UTM zone 32N on the GRS80 ellipsoid (EPSG:25832)
+_UTM_SCALE = 0.9996
+_UTM_FALSE_EASTING = 500000.0
+_UTM_CENTRAL_MERIDIAN = math.radians(9.0)
+_GRS80_A = 6378137.0
+_GRS80_F = 1 / 298.257222101
+_N = _GRS80_F / (2 - _GRS80_F)
+_E = 2 * math.sqrt(_N) / (1 + _N)
+_RECTIFYING_RADIUS = (
+    _GRS80_A / (1 + _N) * (1 + _N**2 / 4 + _N**4 / 64 + _N**6 / 256)
+)
+# Krüger series coefficients, to sixth order in n
+_KRUGER_ALPHA = (
+    _N / 2
+    - 2 * _N**2 / 3
+    + 5 * _N**3 / 16
+    + 41 * _N**4 / 180
+    - 127 * _N**5 / 288
+    + 7891 * _N**6 / 37800,
+    13 * _N**2 / 48
+    - 3 * _N**3 / 5
+    + 557 * _N**4 / 1440
+    + 281 * _N**5 / 630
+    - 1983433 * _N**6 / 1935360,
+    61 * _N**3 / 240
+    - 103 * _N**4 / 140
+    + 15061 * _N**5 / 26880
+    + 167603 * _N**6 / 181440,
+    49561 * _N**4 / 161280 - 179 * _N**5 / 168 + 6601661 * _N**6 / 7257600,
+    34729 * _N**5 / 80640 - 3418889 * _N**6 / 1995840,
+    212378941 * _N**6 / 319334400,
+)
+
+
+def lat_lon_to_utm(lat: float, lon: float) -> tuple[float, float]:
+    """Project latitude/longitude to UTM zone 32N easting/northing.
+
+    Uses the Krüger series, which is accurate to well below a millimetre
+    within the zone.
+    """
+    phi = math.radians(lat)
+    dlon = math.radians(lon) - _UTM_CENTRAL_MERIDIAN
+    sin_phi = math.sin(phi)
+    t = math.sinh(math.atanh(sin_phi) - _E * math.atanh(_E * sin_phi))
+    xi_p = math.atan2(t, math.cos(dlon))
+    eta_p = math.atanh(math.sin(dlon) / math.sqrt(1 + t * t))
+
+    xi = xi_p
+    eta = eta_p
+    for j, alpha in enumerate(_KRUGER_ALPHA, start=1):
+        xi += alpha * math.sin(2 * j * xi_p) * math.cosh(2 * j * eta_p)
+        eta += alpha * math.cos(2 * j * xi_p) * math.sinh(2 * j * eta_p)
+
+    easting = _UTM_FALSE_EASTING + _UTM_SCALE * _RECTIFYING_RADIUS * eta
+    northing = _UTM_SCALE * _RECTIFYING_RADIUS * xi
+    return easting, northing
+
 
 def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> tuple[int, int]:
     """Convert latitude/longitude to tile coordinates."""
-    from pyproj import Transformer
-
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:25832", always_xy=True)
-    utm_x, utm_y = transformer.transform(lon, lat)
+    utm_x, utm_y = lat_lon_to_utm(lat, lon)
 
     tile_size = TILE_GRID_EXTENT_WIDTH / (2**zoom)
     tile_x = math.floor((utm_x - TILE_GRID_ORIGIN_X) / tile_size)
@@ -58,19 +148,22 @@ def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> tuple[int, int]:
     return tile_x, tile_y
 
 
+@lru_cache(maxsize=64)
 def get_neighboring_tiles(
     lat: float, lon: float, zoom: int, radius: int = 1
-) -> list[tuple[int, int]]:
+) -> tuple[tuple[int, int], ...]:
     """Get tile coordinates for a location and its neighbors."""
     center_x, center_y = lat_lon_to_tile(lat, lon, zoom)
-    tiles = []
-    for dx in range(-radius, radius + 1):
-        for dy in range(-radius, radius + 1):
-            tiles.append((center_x + dx, center_y + dy))
-    return tiles
+    return tuple(
+        (center_x + dx, center_y + dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+    )
 
 
-def get_salting_status(salting_time_epoch: int, salting_now: bool) -> SaltingStatus:
+def get_salting_status(
+    salting_time_epoch: int, salting_now: bool, now_ts: float
+) -> SaltingStatus:
     """Determine road status based on salting time."""
     if salting_now:
         return SaltingStatus.SALTING_NOW
@@ -78,9 +171,7 @@ def get_salting_status(salting_time_epoch: int, salting_now: bool) -> SaltingSta
     if salting_time_epoch <= 0:
         return SaltingStatus.UNKNOWN
 
-    now = datetime.now()
-    salting_time = datetime.fromtimestamp(salting_time_epoch)
-    hours_ago = (now - salting_time).total_seconds() / 3600
+    hours_ago = (now_ts - salting_time_epoch) / 3600
 
     # Handle future timestamps (treat as > 48h)
     if hours_ago < 0:
@@ -93,92 +184,178 @@ def get_salting_status(salting_time_epoch: int, salting_now: bool) -> SaltingSta
         return SaltingStatus.MORE_THAN_48H
 
 
+def get_salting_statuses(
+    salting_epochs: list[int], salting_now: list[bool], now_ts: float
+) -> list[SaltingStatus]:
+    """Determine road status for a batch of segments at once."""
+    if np is None:
+        return [
+            get_salting_status(epoch, now, now_ts)
+            for epoch, now in zip(salting_epochs, salting_now)
+        ]
+
+    epochs = np.asarray(salting_epochs, dtype=np.int64)
+    hours_ago = (now_ts - epochs) / 3600
+    status_idx = np.select(
+        [
+            np.asarray(salting_now, dtype=bool),
+            epochs <= 0,
+            hours_ago < 0,  # Future timestamps are treated as > 48h
+            hours_ago < 12,
+            hours_ago < 48,
+        ],
+        [
+            SaltingStatus.SALTING_NOW,
+            SaltingStatus.UNKNOWN,
+            SaltingStatus.MORE_THAN_48H,
+            SaltingStatus.LESS_THAN_12H,
+            SaltingStatus.BETWEEN_12H_48H,
+        ],
+        default=SaltingStatus.MORE_THAN_48H,
+    )
+    return [_STATUS_BY_CODE[code] for code in status_idx.tolist()]
+
+
+def build_road_segments(
+    raw_data: dict[str, list], feature_ids: Iterable[str]
+) -> dict[str, RoadSegment]:
+    """Build road segments for the given feature IDs with valid road classes."""
+    selected = [
+        (fid, raw_data[fid])
+        for fid in feature_ids
+        if raw_data[fid][0] in VALID_ROAD_CLASSES
+    ]
+    statuses = get_salting_statuses(
+        [values[1] for _, values in selected],
+        [values[2] for _, values in selected],
+        time.time(),
+    )
+
+    segments = {}
+    for (feature_id, values), status in zip(selected, statuses):
+        road_class, salting_epoch, salting_now, condition, service_level = values
+        segments[feature_id] = RoadSegment(
+            feature_id=feature_id,
+            road_class=road_class,
+            salting_epoch=salting_epoch,
+            salting_now=salting_now,
+            condition=condition,
+            service_level=service_level,
+            status=status,
+        )
+    return segments
+
+
 class VejdirektoratetAPI:
     """API client for fetching winter road status."""
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        tile_client: httpx.AsyncClient,
+    ) -> None:
+        """Initialize the API client.
+
+        Tile requests go through the HTTP/2 tile client so they multiplex over
+        a single connection. JSON requests use the aiohttp session.
+        """
         self._session = session
+        self._tile_client = tile_client
         self._tile_version: int | None = None
-
-    async def fetch_winter_status(self) -> dict[str, RoadSegment]:
-        """Fetch and parse the winter road status data."""
-        async with self._session.get(WINTER_STATUS_URL) as response:
+        self._tile_semaphore = asyncio.Semaphore(TILE_MAX_CONCURRENCY)
+        self._winter_etag: str | None = None
+        self._winter_cache: dict[str, list] | None = None
+        self._version_etag: str | None = None
+        self._tile_feature_cache: dict[tuple[int, int, int, int], frozenset[str]] = {}
+
+    async def fetch_raw_winter(self) -> dict[str, list]:
+        """Fetch the unparsed winter road status data.
+
+        The previous response is reused when the server reports it unchanged.
+        """
+        headers = {}
+        if self._winter_etag and self._winter_cache is not None:
+            headers["If-None-Match"] = self._winter_etag
+
+        async with self._session.get(WINTER_STATUS_URL, headers=headers) as response:
+            if response.status == 304:
+                _LOGGER.debug("Winter status not modified, using cached data")
+                return self._winter_cache
             response.raise_for_status()
-            raw_data = await response.json()
-
-        segments = {}
-        for feature_id, values in raw_data.items():
-            road_class, salting_epoch, salting_now, condition, service_level = values
-            segments[feature_id] = RoadSegment(
-                feature_id=feature_id,
-                road_class=road_class,
-                salting_time=(
-                    datetime.fromtimestamp(salting_epoch) if salting_epoch > 0 else None
-                ),
-                salting_now=salting_now,
-                condition=condition,
-                service_level=service_level,
-                status=get_salting_status(salting_epoch, salting_now),
-            )
-        return segments
+            raw_data = json_loads(await response.read())
+            self._winter_etag = response.headers.get("ETag")
+            self._winter_cache = raw_data
+            return raw_data
 
     async def fetch_tile_version(self) -> int:
         """Fetch the current tile version from metadata."""
-        async with self._session.get(METADATA_URL) as response:
+        headers = {}
+        if self._version_etag and self._tile_version is not None:
+            headers["If-None-Match"] = self._version_etag
+
+        async with self._session.get(METADATA_URL, headers=headers) as response:
+            if response.status == 304:
+                return self._tile_version
             response.raise_for_status()
-            data = await response.json()
+            data = json_loads(await response.read())
             if "version" not in data:
                 raise ValueError("Missing 'version' in tile metadata")
+            self._version_etag = response.headers.get("ETag")
+            if data["version"] != self._tile_version:
+                # Cached tile contents belong to the old version
+                self._tile_feature_cache.clear()
             self._tile_version = data["version"]
             return self._tile_version
 
     async def fetch_tile_features(
         self, zoom: int, x: int, y: int
-    ) -> list[str]:
-        """Fetch feature IDs from a tile using our custom MVT decoder."""
-        from .mvt_decoder import extract_feature_ids
+    ) -> frozenset[str]:
+        """Fetch feature IDs from a tile using our custom MVT decoder.
 
-        if self._tile_version is None:
-            await self.fetch_tile_version()
+        fetch_tile_version must have been called first. Results are cached
+        per tile until the tile version changes.
+        """
+        cache_key = (self._tile_version, zoom, x, y)
+        if (cached := self._tile_feature_cache.get(cache_key)) is not None:
+            return cached
 
         url = TILE_URL_PATTERN.format(version=self._tile_version, z=zoom, x=x, y=y)
 
         try:
-            async with self._session.get(url) as response:
+            async with self._tile_semaphore:
+                response = await self._tile_client.get(url)
                 response.raise_for_status()
-                content = await response.read()
+                content = response.content
 
-            return extract_feature_ids(content)
+            # Parsing (and the first numba compile) would block the event loop
+            feature_ids = frozenset(
+                await asyncio.get_running_loop().run_in_executor(
+                    None, extract_feature_ids, content
+                )
+            )
 
         except Exception as err:
             _LOGGER.warning("Failed to fetch tile %s/%s/%s: %s", zoom, x, y, err)
-            return []
+            return frozenset()
+
+        self._tile_feature_cache[cache_key] = feature_ids
+        return feature_ids
 
     async def get_roads_near_location(
         self, lat: float, lon: float, zoom: int = 12
     ) -> dict[str, RoadSegment]:
         """Get all road segments near a location (3x3 tile grid)."""
-        # Fetch status data
-        all_segments = await self.fetch_winter_status()
-
-        # Get tiles around the location
-        tiles = get_neighboring_tiles(lat, lon, zoom, radius=1)
-
-        # Fetch features from all tiles
-        nearby_feature_ids = set()
-        for tile_x, tile_y in tiles:
-            feature_ids = await self.fetch_tile_features(zoom, tile_x, tile_y)
-            nearby_feature_ids.update(feature_ids)
+        # Fetch status data and nearby tile features concurrently
+        raw_data, nearby_feature_ids = await asyncio.gather(
+            self.fetch_raw_winter(),
+            self._fetch_nearby_feature_ids(lat, lon, zoom),
+        )
 
         if nearby_feature_ids:
-            # Filter segments to only those in the nearby tiles with valid road classes
-            result = {
-                fid: segment
-                for fid, segment in all_segments.items()
-                if fid in nearby_feature_ids
-                and segment.road_class in VALID_ROAD_CLASSES
-            }
+            # Only build segments for roads in the nearby tiles
+            result = build_road_segments(
+                raw_data, nearby_feature_ids & raw_data.keys()
+            )
             _LOGGER.info(
                 "Found %d roads in 3x3 grid around (%.4f, %.4f)",
                 len(result), lat, lon
@@ -187,3 +364,34 @@ class VejdirektoratetAPI:
 
         _LOGGER.warning("No roads found in tiles, returning empty")
         return {}
+
+    async def _fetch_nearby_feature_ids(
+        self, lat: float, lon: float, zoom: int
+    ) -> set[str]:
+        """Fetch the feature IDs of all tiles around a location."""
+        await self.fetch_tile_version()
+
+        # Get tiles around the location
+        tiles = get_neighboring_tiles(lat, lon, zoom, radius=1)
+        return await self._fetch_features_for_tiles(zoom, tiles)
+
+    async def _fetch_features_for_tiles(
+        self, zoom: int, tiles: Iterable[tuple[int, int]]
+    ) -> set[str]:
+        """Fetch the union of feature IDs for a set of tiles.
+
+        The tile version must already be fetched. The tile server only serves
+        individual tiles, so these are requested concurrently rather than as
+        a single batched query.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_tile_features(zoom, tx, ty) for tx, ty in tiles),
+            return_exceptions=True,
+        )
+        nearby_feature_ids = set()
+        for feature_ids in results:
+            if isinstance(feature_ids, BaseException):
+                _LOGGER.warning("Failed to fetch tile: %s", feature_ids)
+                continue
+            nearby_feature_ids.update(feature_ids)
+        return nearby_feature_ids
@@ -1,6 +1,7 @@
 """Constants for the Vejdirektoratet integration."""
 
 DOMAIN = "vejdirektoratet_unofficial"
+DATA_TILE_CLIENT = f"{DOMAIN}_tile_client"
 
 # API URLs
 WINTER_STATUS_URL = "https://storage.googleapis.com/trafikkort-data-tiles/winter.json"
@@ -12,6 +13,9 @@ TILE_GRID_ORIGIN_X = 120000
 TILE_GRID_ORIGIN_Y = 6500000
 TILE_GRID_EXTENT_WIDTH = 1258291.2
 
+# Maximum number of tile requests in flight at once
+TILE_MAX_CONCURRENCY = 8
+
 # Default values
 DEFAULT_ZOOM = 12
 DEFAULT_SCAN_INTERVAL = 1800  # 30 minutes
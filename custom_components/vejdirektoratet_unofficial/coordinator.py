@@ -11,6 +11,14 @@ from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, DEFAULT_ZOOM
 
 _LOGGER = logging.getLogger(__name__)
 
+# Statuses from best to worst, used to pick the overall status
+_STATUS_PRIORITY = (
+    SaltingStatus.SALTING_NOW,
+    SaltingStatus.LESS_THAN_12H,
+    SaltingStatus.BETWEEN_12H_48H,
+    SaltingStatus.MORE_THAN_48H,
+)
+
 
 class VejdirektoratetCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching winter road data."""
@@ -43,26 +51,21 @@ class VejdirektoratetCoordinator(DataUpdateCoordinator):
             )
 
             # Calculate summary statistics
-            status_counts = {status: 0 for status in SaltingStatus}
+            # Counts indexed by status code
+            status_counts = [0] * len(SaltingStatus)
             for segment in roads.values():
                 status_counts[segment.status] += 1
 
             # Determine overall status (best case)
-            if status_counts[SaltingStatus.SALTING_NOW] > 0:
-                overall_status = SaltingStatus.SALTING_NOW
-            elif status_counts[SaltingStatus.LESS_THAN_12H] > 0:
-                overall_status = SaltingStatus.LESS_THAN_12H
-            elif status_counts[SaltingStatus.BETWEEN_12H_48H] > 0:
-                overall_status = SaltingStatus.BETWEEN_12H_48H
-            elif status_counts[SaltingStatus.MORE_THAN_48H] > 0:
-                overall_status = SaltingStatus.MORE_THAN_48H
-            else:
-                overall_status = SaltingStatus.UNKNOWN
+            overall_status = next(
+                (status for status in _STATUS_PRIORITY if status_counts[status]),
+                SaltingStatus.UNKNOWN,
+            )
 
             _LOGGER.debug(
                 "Updated Vejdirektoratet data: %d roads, overall status: %s",
                 len(roads),
-                overall_status.value,
+                overall_status.key,
             )
 
             return {
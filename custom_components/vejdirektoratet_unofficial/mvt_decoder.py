@@ -2,20 +2,35 @@
 
 This is a pure-Python implementation that only extracts feature properties,
 avoiding the need for mapbox-vector-tile which requires C++ compilation.
+When numba is installed, the tile walk in extract_feature_ids is compiled
+instead; the pure-Python decoders below remain the fallback.
 """
 
 import gzip
-import struct
 
+try:
+    import numpy as np
+    from numba import config as numba_config, njit
+except ImportError:
+    np = None
+    njit = None
 
-def decode_varint(data: bytes, pos: int) -> tuple[int, int]:
-    """Decode a varint from the data at position pos."""
+_FEATURE_ID_KEY = b"featureId"
+
+# Value kinds reported by the compiled scanner
+_VALUE_NONE = 0
+_VALUE_STRING = 1  # (start, end) span of the UTF-8 bytes
+_VALUE_INT = 2  # integer value, stringified in Python
+
+
+def decode_varint(buf: memoryview, pos: int, end: int) -> tuple[int, int]:
+    """Decode a varint from buf at position pos, not reading past end."""
     result = 0
     shift = 0
     while True:
-        if pos >= len(data):
+        if pos >= end:
             raise ValueError("Unexpected end of data while reading varint")
-        byte = data[pos]
+        byte = buf[pos]
         pos += 1
         result |= (byte & 0x7F) << shift
         if (byte & 0x80) == 0:
@@ -24,19 +39,22 @@ def decode_varint(data: bytes, pos: int) -> tuple[int, int]:
     return result, pos
 
 
-def decode_sint(value: int) -> int:
-    """Decode a zigzag-encoded signed integer."""
-    return (value >> 1) ^ -(value & 1)
+def _field_end(pos: int, length: int, end: int, name: str) -> int:
+    """Return the end of a length-delimited field, checking it fits in end."""
+    field_end = pos + length
+    if field_end > end:
+        raise ValueError(f"Unexpected end of data while reading {name}")
+    return field_end
 
 
-def skip_field(data: bytes, pos: int, wire_type: int) -> int:
+def skip_field(buf: memoryview, pos: int, end: int, wire_type: int) -> int:
     """Skip a field based on its wire type."""
     if wire_type == 0:  # Varint
-        _, pos = decode_varint(data, pos)
+        _, pos = decode_varint(buf, pos, end)
     elif wire_type == 1:  # 64-bit
         pos += 8
     elif wire_type == 2:  # Length-delimited
-        length, pos = decode_varint(data, pos)
+        length, pos = decode_varint(buf, pos, end)
         pos += length
     elif wire_type == 5:  # 32-bit
         pos += 4
@@ -45,105 +63,288 @@ def skip_field(data: bytes, pos: int, wire_type: int) -> int:
     return pos
 
 
-def decode_value(data: bytes) -> str | int | float | bool | None:
-    """Decode a protobuf Value message."""
-    pos = 0
-    while pos < len(data):
-        tag, pos = decode_varint(data, pos)
+def decode_value(buf: memoryview, pos: int, end: int) -> str | None:
+    """Decode a protobuf Value message as a string.
+
+    String and int/uint values are returned as strings; float, double, sint
+    and bool values are skipped.
+    """
+    while pos < end:
+        tag, pos = decode_varint(buf, pos, end)
         field_num = tag >> 3
         wire_type = tag & 0x7
 
         if field_num == 1 and wire_type == 2:  # string_value
-            length, pos = decode_varint(data, pos)
-            return data[pos : pos + length].decode("utf-8")
-        elif field_num == 2 and wire_type == 5:  # float_value
-            return struct.unpack("<f", data[pos : pos + 4])[0]
-        elif field_num == 3 and wire_type == 1:  # double_value
-            return struct.unpack("<d", data[pos : pos + 8])[0]
-        elif field_num == 4 and wire_type == 0:  # int_value
-            val, pos = decode_varint(data, pos)
-            return val
-        elif field_num == 5 and wire_type == 0:  # uint_value
-            val, pos = decode_varint(data, pos)
-            return val
-        elif field_num == 6 and wire_type == 0:  # sint_value
-            val, pos = decode_varint(data, pos)
-            return decode_sint(val)
-        elif field_num == 7 and wire_type == 0:  # bool_value
-            val, pos = decode_varint(data, pos)
-            return val != 0
+            length, pos = decode_varint(buf, pos, end)
+            return str(buf[pos : _field_end(pos, length, end, "string")], "utf-8")
+        elif field_num in (4, 5) and wire_type == 0:  # int_value / uint_value
+            val, pos = decode_varint(buf, pos, end)
+            return str(val)
+        elif field_num <= 7 and wire_type in (0, 1, 5):  # numeric/bool value
+            return None
         else:
-            pos = skip_field(data, pos, wire_type)
+            pos = skip_field(buf, pos, end, wire_type)
 
     return None
 
 
-def decode_feature(data: bytes, keys: list[str], values: list) -> dict:
-    """Decode a Feature message and return its properties."""
-    pos = 0
-    tags = []
-    properties = {}
-
-    while pos < len(data):
-        tag, pos = decode_varint(data, pos)
+def decode_feature(
+    buf: memoryview,
+    pos: int,
+    end: int,
+    featureid_key_idx: int,
+    values: list[str | None],
+) -> str | None:
+    """Decode a Feature message and return its featureId, if any."""
+    feature_id = None
+    key_idx = None
+    num_values = len(values)
+
+    while pos < end:
+        tag, pos = decode_varint(buf, pos, end)
         field_num = tag >> 3
         wire_type = tag & 0x7
 
         if field_num == 2 and wire_type == 2:  # tags (packed uint32)
-            length, pos = decode_varint(data, pos)
-            end = pos + length
-            while pos < end:
-                val, pos = decode_varint(data, pos)
-                tags.append(val)
+            length, pos = decode_varint(buf, pos, end)
+            tags_end = _field_end(pos, length, end, "tags")
+            while pos < tags_end:
+                val, pos = decode_varint(buf, pos, tags_end)
+                if key_idx is None:
+                    key_idx = val
+                    continue
+                if key_idx == featureid_key_idx and val < num_values:
+                    feature_id = values[val]
+                key_idx = None
         else:
-            pos = skip_field(data, pos, wire_type)
-
-    # Convert tags to properties
-    for i in range(0, len(tags), 2):
-        if i + 1 < len(tags):
-            key_idx = tags[i]
-            val_idx = tags[i + 1]
-            if key_idx < len(keys) and val_idx < len(values):
-                properties[keys[key_idx]] = values[val_idx]
+            pos = skip_field(buf, pos, end, wire_type)
 
-    return properties
+    return feature_id
 
 
-def decode_layer(data: bytes) -> list[dict]:
-    """Decode a Layer message and return feature properties."""
-    pos = 0
-    keys = []
+def decode_layer(buf: memoryview, pos: int, end: int) -> list[str]:
+    """Decode a Layer message and return the featureId of each feature."""
+    featureid_key_idx = None
+    num_keys = 0
     values = []
-    features_data = []
+    feature_spans = []
 
-    while pos < len(data):
-        tag, pos = decode_varint(data, pos)
+    while pos < end:
+        tag, pos = decode_varint(buf, pos, end)
         field_num = tag >> 3
         wire_type = tag & 0x7
 
         if field_num == 3 and wire_type == 2:  # keys
-            length, pos = decode_varint(data, pos)
-            keys.append(data[pos : pos + length].decode("utf-8"))
-            pos += length
+            length, pos = decode_varint(buf, pos, end)
+            key_end = _field_end(pos, length, end, "key")
+            if featureid_key_idx is None and buf[pos:key_end] == _FEATURE_ID_KEY:
+                featureid_key_idx = num_keys
+            num_keys += 1
+            pos = key_end
         elif field_num == 4 and wire_type == 2:  # values
-            length, pos = decode_varint(data, pos)
-            value = decode_value(data[pos : pos + length])
-            values.append(value)
-            pos += length
+            length, pos = decode_varint(buf, pos, end)
+            value_end = _field_end(pos, length, end, "value")
+            values.append(decode_value(buf, pos, value_end))
+            pos = value_end
         elif field_num == 2 and wire_type == 2:  # features
-            length, pos = decode_varint(data, pos)
-            features_data.append(data[pos : pos + length])
-            pos += length
+            length, pos = decode_varint(buf, pos, end)
+            feature_end = _field_end(pos, length, end, "feature")
+            feature_spans.append((pos, feature_end))
+            pos = feature_end
         else:
-            pos = skip_field(data, pos, wire_type)
+            pos = skip_field(buf, pos, end, wire_type)
+
+    if featureid_key_idx is None:
+        return []
 
-    # Now decode features with the collected keys and values
-    features = []
-    for feature_data in features_data:
-        props = decode_feature(feature_data, keys, values)
-        features.append(props)
+    # Now match the features against the collected values
+    feature_ids = []
+    for start, stop in feature_spans:
+        feature_id = decode_feature(buf, start, stop, featureid_key_idx, values)
+        if feature_id is not None:
+            feature_ids.append(feature_id)
 
-    return features
+    return feature_ids
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _decode_varint_nb(buf, pos):
+        """Decode a varint from a uint8 array at position pos."""
+        result = 0
+        shift = 0
+        n = buf.shape[0]
+        while True:
+            if pos >= n:
+                raise ValueError("Unexpected end of data while reading varint")
+            byte = np.int64(buf[pos])
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if (byte & 0x80) == 0:
+                break
+            shift += 7
+        return result, pos
+
+    @njit(cache=True)
+    def _skip_field_nb(buf, pos, wire_type):
+        """Skip a field based on its wire type."""
+        if wire_type == 0:
+            _, pos = _decode_varint_nb(buf, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _decode_varint_nb(buf, pos)
+            pos += length
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError("Unknown wire type")
+        return pos
+
+    @njit(cache=True)
+    def _grow_nb(arr):
+        """Return a copy of a 2D array with twice the rows."""
+        grown = np.empty((arr.shape[0] * 2, arr.shape[1]), dtype=arr.dtype)
+        grown[: arr.shape[0]] = arr
+        return grown
+
+    @njit(cache=True)
+    def _scan_value_nb(buf, pos, end):
+        """Classify a Value message the same way decode_value does.
+
+        Returns (kind, a, b): a string's (start, end) span, an integer in a,
+        or _VALUE_NONE for anything else.
+        """
+        while pos < end:
+            tag, pos = _decode_varint_nb(buf, pos)
+            field_num = tag >> 3
+            wire_type = tag & 0x7
+            if field_num == 1 and wire_type == 2:
+                length, pos = _decode_varint_nb(buf, pos)
+                return _VALUE_STRING, pos, pos + length
+            if (field_num == 4 or field_num == 5) and wire_type == 0:
+                val, pos = _decode_varint_nb(buf, pos)
+                return _VALUE_INT, val, 0
+            if field_num <= 7 and (wire_type == 0 or wire_type == 1 or wire_type == 5):
+                break
+            pos = _skip_field_nb(buf, pos, wire_type)
+        return _VALUE_NONE, 0, 0
+
+    @njit(cache=True)
+    def _scan_layer_nb(buf, start, end, key_name, out, count):
+        """Append featureId values for every feature in a layer."""
+        # First pass: keys and values, which may follow the features
+        featureid_key_idx = -1
+        values = np.empty((16, 3), dtype=np.int64)
+        num_keys = 0
+        num_values = 0
+        key_len = key_name.shape[0]
+        pos = start
+        while pos < end:
+            tag, pos = _decode_varint_nb(buf, pos)
+            field_num = tag >> 3
+            wire_type = tag & 0x7
+            if field_num == 3 and wire_type == 2:
+                length, pos = _decode_varint_nb(buf, pos)
+                if pos + length > end:
+                    raise ValueError("Unexpected end of data while reading key")
+                if featureid_key_idx < 0 and length == key_len:
+                    match = True
+                    for i in range(key_len):
+                        if buf[pos + i] != key_name[i]:
+                            match = False
+                            break
+                    if match:
+                        featureid_key_idx = num_keys
+                num_keys += 1
+                pos += length
+            elif field_num == 4 and wire_type == 2:
+                length, pos = _decode_varint_nb(buf, pos)
+                if num_values == values.shape[0]:
+                    values = _grow_nb(values)
+                kind, a, b = _scan_value_nb(buf, pos, pos + length)
+                values[num_values, 0] = kind
+                values[num_values, 1] = a
+                values[num_values, 2] = b
+                num_values += 1
+                pos += length
+            else:
+                pos = _skip_field_nb(buf, pos, wire_type)
+
+        if featureid_key_idx < 0:
+            return out, count
+
+        # Second pass: match each feature's tags against the featureId key
+        pos = start
+        while pos < end:
+            tag, pos = _decode_varint_nb(buf, pos)
+            field_num = tag >> 3
+            wire_type = tag & 0x7
+            if not (field_num == 2 and wire_type == 2):
+                pos = _skip_field_nb(buf, pos, wire_type)
+                continue
+            length, pos = _decode_varint_nb(buf, pos)
+            feature_end = pos + length
+            found = -1
+            key_idx = -1
+            while pos < feature_end:
+                ftag, pos = _decode_varint_nb(buf, pos)
+                if ftag >> 3 == 2 and ftag & 0x7 == 2:  # tags (packed uint32)
+                    tags_len, pos = _decode_varint_nb(buf, pos)
+                    tags_end = pos + tags_len
+                    while pos < tags_end:
+                        val, pos = _decode_varint_nb(buf, pos)
+                        if key_idx < 0:
+                            key_idx = val
+                        else:
+                            if key_idx == featureid_key_idx and val < num_values:
+                                found = val
+                            key_idx = -1
+                else:
+                    pos = _skip_field_nb(buf, pos, ftag & 0x7)
+            if found >= 0 and values[found, 0] != _VALUE_NONE:
+                if count == out.shape[0]:
+                    out = _grow_nb(out)
+                out[count, 0] = values[found, 0]
+                out[count, 1] = values[found, 1]
+                out[count, 2] = values[found, 2]
+                count += 1
+        return out, count
+
+    @njit(cache=True)
+    def _scan_tile_feature_ids_nb(buf, key_name):
+        """Walk a whole tile and return (kind, a, b) featureId values."""
+        out = np.empty((64, 3), dtype=np.int64)
+        count = 0
+        pos = 0
+        n = buf.shape[0]
+        while pos < n:
+            tag, pos = _decode_varint_nb(buf, pos)
+            field_num = tag >> 3
+            wire_type = tag & 0x7
+            if field_num == 3 and wire_type == 2:  # layer
+                length, pos = _decode_varint_nb(buf, pos)
+                if pos + length > n:
+                    raise ValueError("Unexpected end of data while reading layer")
+                out, count = _scan_layer_nb(
+                    buf, pos, pos + length, key_name, out, count
+                )
+                pos += length
+            else:
+                pos = _skip_field_nb(buf, pos, wire_type)
+        return out[:count]
+
+
+def _extract_feature_ids_nb(tile_data: bytes) -> list[str]:
+    """Extract featureId values using the compiled tile scanner."""
+    buf = np.frombuffer(tile_data, dtype=np.uint8)
+    key_name = np.frombuffer(_FEATURE_ID_KEY, dtype=np.uint8)
+    mv = memoryview(tile_data)
+    return [
+        str(mv[a:b], "utf-8") if kind == _VALUE_STRING else str(a)
+        for kind, a, b in _scan_tile_feature_ids_nb(buf, key_name).tolist()
+    ]
 
 
 def extract_feature_ids(tile_data: bytes) -> list[str]:
@@ -159,25 +360,25 @@ def extract_feature_ids(tile_data: bytes) -> list[str]:
     if tile_data[:2] == b"\x1f\x8b":
         tile_data = gzip.decompress(tile_data)
 
+    if njit is not None and not numba_config.DISABLE_JIT:
+        return _extract_feature_ids_nb(tile_data)
+
+    buf = memoryview(tile_data)
+    end = len(buf)
     feature_ids = []
     pos = 0
 
-    while pos < len(tile_data):
-        tag, pos = decode_varint(tile_data, pos)
+    while pos < end:
+        tag, pos = decode_varint(buf, pos, end)
         field_num = tag >> 3
         wire_type = tag & 0x7
 
         if field_num == 3 and wire_type == 2:  # layer
-            length, pos = decode_varint(tile_data, pos)
-            layer_data = tile_data[pos : pos + length]
-            pos += length
-
-            features = decode_layer(layer_data)
-            for props in features:
-                feature_id = props.get("featureId")
-                if feature_id is not None:
-                    feature_ids.append(str(feature_id))
+            length, pos = decode_varint(buf, pos, end)
+            layer_end = _field_end(pos, length, end, "layer")
+            feature_ids.extend(decode_layer(buf, pos, layer_end))
+            pos = layer_end
         else:
-            pos = skip_field(tile_data, pos, wire_type)
+            pos = skip_field(buf, pos, end, wire_type)
 
     return feature_ids
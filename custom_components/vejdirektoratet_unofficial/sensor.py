@@ -11,21 +11,30 @@ from .const import DOMAIN
 from .coordinator import VejdirektoratetCoordinator
 
 
-STATUS_ICONS = {
-    SaltingStatus.SALTING_NOW: "mdi:snowflake-alert",
-    SaltingStatus.LESS_THAN_12H: "mdi:snowflake-check",
-    SaltingStatus.BETWEEN_12H_48H: "mdi:snowflake",
-    SaltingStatus.MORE_THAN_48H: "mdi:snowflake-off",
-    SaltingStatus.UNKNOWN: "mdi:help-circle-outline",
-}
-
-STATUS_DESCRIPTIONS = {
-    SaltingStatus.SALTING_NOW: "Salting Now",
-    SaltingStatus.LESS_THAN_12H: "Salted < 12h ago",
-    SaltingStatus.BETWEEN_12H_48H: "Salted 12-48h ago",
-    SaltingStatus.MORE_THAN_48H: "Salted > 48h ago",
-    SaltingStatus.UNKNOWN: "Unknown",
-}
+# Lookup tables indexed by SaltingStatus value
+STATUS_ICONS = (
+    "mdi:snowflake-alert",  # SALTING_NOW
+    "mdi:snowflake-check",  # LESS_THAN_12H
+    "mdi:snowflake",  # BETWEEN_12H_48H
+    "mdi:snowflake-off",  # MORE_THAN_48H
+    "mdi:help-circle-outline",  # UNKNOWN
+)
+
+STATUS_DESCRIPTIONS = (
+    "Salting Now",
+    "Salted < 12h ago",
+    "Salted 12-48h ago",
+    "Salted > 48h ago",
+    "Unknown",
+)
+
+COUNT_SENSOR_NAMES = (
+    "Salting Now",
+    "Salted < 12h",
+    "Salted 12-48h",
+    "Salted > 48h",
+    "Unknown Status",
+)
 
 
 async def async_setup_entry(
@@ -39,12 +48,11 @@ async def async_setup_entry(
     entities = [
         VejdirektoratetOverallSensor(coordinator, entry),
         VejdirektoratetTotalSensor(coordinator, entry),
-        VejdirektoratetSaltingNowSensor(coordinator, entry),
-        VejdirektoratetLessThan12hSensor(coordinator, entry),
-        VejdirektoratetBetween12h48hSensor(coordinator, entry),
-        VejdirektoratetMoreThan48hSensor(coordinator, entry),
-        VejdirektoratetUnknownSensor(coordinator, entry),
     ]
+    entities.extend(
+        VejdirektoratetCountSensor(coordinator, entry, status)
+        for status in SaltingStatus
+    )
 
     async_add_entities(entities)
 
@@ -81,28 +89,28 @@ class VejdirektoratetOverallSensor(VejdirektoratetBaseSensor):
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        status = self.coordinator.data.get("overall_status", SaltingStatus.UNKNOWN)
-        return STATUS_DESCRIPTIONS.get(status, "Unknown")
+        return STATUS_DESCRIPTIONS[data["overall_status"]]
 
     @property
     def icon(self) -> str:
         """Return the icon based on status."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return "mdi:snowflake-variant"
-        status = self.coordinator.data.get("overall_status", SaltingStatus.UNKNOWN)
-        return STATUS_ICONS.get(status, "mdi:snowflake-variant")
+        return STATUS_ICONS[data["overall_status"]]
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        status = self.coordinator.data.get("overall_status", SaltingStatus.UNKNOWN)
         return {
-            "status_code": status.value,
-            "total_roads": self.coordinator.data.get("total_roads", 0),
+            "status_code": data["overall_status"].key,
+            "total_roads": data["total_roads"],
         }
 
 
@@ -117,9 +125,10 @@ class VejdirektoratetTotalSensor(VejdirektoratetBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.get("total_roads", 0)
+        return data["total_roads"]
 
     @property
     def icon(self) -> str:
@@ -128,74 +137,32 @@ class VejdirektoratetTotalSensor(VejdirektoratetBaseSensor):
 
 
 class VejdirektoratetCountSensor(VejdirektoratetBaseSensor):
-    """Base class for count sensors."""
+    """Sensor showing the number of roads with a given salting status."""
 
-    _status: SaltingStatus
+    def __init__(
+        self,
+        coordinator: VejdirektoratetCoordinator,
+        entry: ConfigEntry,
+        status: SaltingStatus,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, status.key, COUNT_SENSOR_NAMES[status])
+        self._status = status
 
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        counts = self.coordinator.data.get("status_counts", {})
-        return counts.get(self._status, 0)
+        return data["status_counts"][self._status]
 
     @property
     def icon(self) -> str:
         """Return the icon based on status."""
-        return STATUS_ICONS.get(self._status, "mdi:snowflake-variant")
+        return STATUS_ICONS[self._status]
 
     @property
     def native_unit_of_measurement(self) -> str:
         """Return the unit of measurement."""
         return "roads"
-
-
-class VejdirektoratetSaltingNowSensor(VejdirektoratetCountSensor):
-    """Sensor showing roads being salted now."""
-
-    _status = SaltingStatus.SALTING_NOW
-
-    def __init__(self, coordinator: VejdirektoratetCoordinator, entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, "salting_now", "Salting Now")
-
-
-class VejdirektoratetLessThan12hSensor(VejdirektoratetCountSensor):
-    """Sensor showing roads salted less than 12h ago."""
-
-    _status = SaltingStatus.LESS_THAN_12H
-
-    def __init__(self, coordinator: VejdirektoratetCoordinator, entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, "less_than_12h", "Salted < 12h")
-
-
-class VejdirektoratetBetween12h48hSensor(VejdirektoratetCountSensor):
-    """Sensor showing roads salted between 12h and 48h ago."""
-
-    _status = SaltingStatus.BETWEEN_12H_48H
-
-    def __init__(self, coordinator: VejdirektoratetCoordinator, entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, "between_12h_48h", "Salted 12-48h")
-
-
-class VejdirektoratetMoreThan48hSensor(VejdirektoratetCountSensor):
-    """Sensor showing roads salted more than 48h ago."""
-
-    _status = SaltingStatus.MORE_THAN_48H
-
-    def __init__(self, coordinator: VejdirektoratetCoordinator, entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, "more_than_48h", "Salted > 48h")
-
-
-class VejdirektoratetUnknownSensor(VejdirektoratetCountSensor):
-    """Sensor showing roads with unknown salting status."""
-
-    _status = SaltingStatus.UNKNOWN
-
-    def __init__(self, coordinator: VejdirektoratetCoordinator, entry: ConfigEntry) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, "unknown", "Unknown Status")